@@ -1,8 +1,14 @@
 #Import required Libraries
 import streamlit as st
+import os
 import pickle
 import pandas as pd
-import requests
+import numpy as np
+import asyncio
+import aiohttp
+import orjson
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 #Hide Streamlit Menu and Default Footer
 hide_menu_style = """
@@ -13,24 +19,65 @@ footer {visibility: hidden;}
 """
 st.markdown(hide_menu_style, unsafe_allow_html=True)
 
-#Fetch posters from TMDb Database
-def fetch_poster(movie_id):
-	response = requests.get('https://api.themoviedb.org/3/movie/{}?api_key=[TMDb-API-KEY]&language=en-US'.format(movie_id))
-	data = response.json()
-	return "https://image.tmdb.org/t/p/w500/" + data['poster_path']
+TMDB_API_KEY = os.environ.get('TMDB_API_KEY', '[TMDb-API-KEY]')
+POSTER_PREFIX = "https://image.tmdb.org/t/p/w500/"
+PLACEHOLDER_POSTER = "https://via.placeholder.com/500x750.png?text=Poster+Unavailable"
+
+#Fetch posters from TMDb Database, retrying transient failures with backoff
+async def fetch_poster(session, movie_id):
+	for attempt in range(3):
+		try:
+			async with session.get(f'https://api.themoviedb.org/3/movie/{movie_id}?api_key={TMDB_API_KEY}&language=en-US') as response:
+				data = orjson.loads(await response.read())
+			break
+		except (aiohttp.ClientError, asyncio.TimeoutError):
+			if attempt == 2:
+				raise
+			await asyncio.sleep(0.3 * (attempt + 1))
+	poster_path = data.get('poster_path')
+	return POSTER_PREFIX + poster_path if poster_path else PLACEHOLDER_POSTER
+
+#Cache poster URLs in-process since poster_path is immutable per movie;
+#held in cache_resource so the dict survives script reruns
+@st.cache_resource
+def get_poster_cache():
+	return {}
+
+poster_cache = get_poster_cache()
+
+#Keep one event loop and TMDb session alive across reruns so connections are reused
+@st.cache_resource
+def get_session():
+	loop = asyncio.new_event_loop()
+	threading.Thread(target=loop.run_forever, daemon=True).start()
+	async def open_session():
+		connector = aiohttp.TCPConnector(limit=16, ttl_dns_cache=300)
+		return aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=5))
+	session = asyncio.run_coroutine_threadsafe(open_session(), loop).result()
+	return loop, session
+
+#Fetch all posters concurrently over the shared session, skipping cached ids
+async def fetch_all_posters(session, movie_ids):
+	missing = [movie_id for movie_id in movie_ids if movie_id not in poster_cache]
+	if missing:
+		posters = await asyncio.gather(*[fetch_poster(session, movie_id) for movie_id in missing], return_exceptions=True)
+		for movie_id, poster in zip(missing, posters):
+			if not isinstance(poster, Exception):
+				poster_cache[movie_id] = poster
+	return [poster_cache.get(movie_id, PLACEHOLDER_POSTER) for movie_id in movie_ids]
 
 #Recommend movies based on  content
 def recommend(movie):
-	movie_index = movies[movies['original_title'] == movie].index[0]
-	distances = similarity[movie_index]
-	movies_list = sorted(list(enumerate(distances)), reverse=True, key=lambda x:  x[1])[1:6]
-
-	recommended_movies = []
-	recommended_movies_poster = []
-	for  i in movies_list:
-		movie_id = movies.iloc[i[0]].id
-		recommended_movies.append(movies.iloc[i[0]].original_title)
-		recommended_movies_poster.append(fetch_poster(movie_id))
+	movie_index = title_to_index.get(movie)
+	if movie_index is None:
+		st.error('Could not find the selected movie in the catalog')
+		return [], []
+	top_indices = top5[movie_index]
+
+	recommended_movies = titles[top_indices].tolist()
+	movie_ids = ids[top_indices].tolist()
+	loop, session = get_session()
+	recommended_movies_poster = asyncio.run_coroutine_threadsafe(fetch_all_posters(session, movie_ids), loop).result()
 	return recommended_movies,recommended_movies_poster
 
 #Frontend Design for StreamLit WebApp Sidebar
@@ -42,35 +89,56 @@ st.sidebar.text("Natural Language Processing")
 st.sidebar.subheader("Developed By")
 st.sidebar.text("Ashwin Raj, Student at UCEK")
 
-movies_dict = pickle.load(open('pickle/movie_dict.pkl','rb'))
-movies = pd.DataFrame(movies_dict)
+#Build the (N, 5) neighbour table once so the NxN matrix never sits in the request path
+def build_top5(similarity):
+	top5 = np.empty((similarity.shape[0], 5), dtype=np.int32)
+	for movie_index in range(similarity.shape[0]):
+		distances = np.asarray(similarity[movie_index])
+		top_indices = np.argpartition(-distances, 6)[:6]
+		top_indices = top_indices[np.argsort(-distances[top_indices])]
+		top5[movie_index] = top_indices[top_indices != movie_index][:5]
+	return top5
+
+#Load the movies table, converting the legacy pickle to Parquet on first run
+def load_movies():
+	if not os.path.exists('pickle/movies.parquet'):
+		movies_dict = pickle.load(open('pickle/movie_dict.pkl','rb'))
+		pd.DataFrame(movies_dict).to_parquet('pickle/movies.parquet')
+	return pd.read_parquet('pickle/movies.parquet')
+
+#Load the neighbour table, building it from the similarity matrix on first run
+def load_top5():
+	if not os.path.exists('pickle/top5.npy'):
+		if not os.path.exists('pickle/similarity.npy'):
+			similarity = np.asarray(pickle.load(open('pickle/similarity.pkl','rb'))).astype(np.float16)
+			np.save('pickle/similarity.npy', similarity)
+		np.save('pickle/top5.npy', build_top5(np.load('pickle/similarity.npy', mmap_mode='r')))
+	return np.load('pickle/top5.npy')
+
+#Load both artifacts in parallel, once per process, shared across reruns
+@st.cache_resource
+def load_data():
+	with ThreadPoolExecutor(max_workers=2) as executor:
+		movies_future = executor.submit(load_movies)
+		top5_future = executor.submit(load_top5)
+		movies, top5 = movies_future.result(), top5_future.result()
+	titles = movies['original_title'].to_numpy()
+	ids = movies['id'].to_numpy()
+	title_to_index = {title: index for index, title in enumerate(titles)}
+	return titles, ids, title_to_index, top5
 
-similarity = pickle.load(open('pickle/similarity.pkl','rb'))
+titles, ids, title_to_index, top5 = load_data()
 
 #Frontend Hero Section
 st.title("Movie Recommender System")
 
 selected_movie_name = st.selectbox(
 'Select a movie to recommend',
-movies['original_title'].values)
+titles)
 
 #Output Recommendations with Posters
 if st.button('Recommend'):
 	name, posters = recommend(selected_movie_name)
 	
-	col1, col2, col3, col4,  col5 = st.columns(5)
-	with col1:
-		st.text(name[0])
-		st.image(posters[0])
-	with col2:
-		st.text(name[1])
-		st.image(posters[1])
-	with col3:
-		st.text(name[2])
-		st.image(posters[2])
-	with col4:
-		st.text(name[3])
-		st.image(posters[3])
-	with col5:
-		st.text(name[4])
-		st.image(posters[4])
+	for col, movie_name, poster in zip(st.columns(5), name, posters):
+		col.markdown(f"<img src='{poster}' style='width:100%'><p style='text-align:center'>{movie_name}</p>", unsafe_allow_html=True)